@@ -24,7 +24,8 @@ class TestNN(unittest.TestCase):
         if track_running_stats:
           bn.running_mean = Tensor.randn(sz)
           bn.running_var = Tensor.randn(sz)
-          bn.running_var.numpy()[bn.running_var.numpy() < 0] = 0
+        Tensor.realize(bn.weight, bn.bias, *([bn.running_mean, bn.running_var] if track_running_stats else []))
+        if track_running_stats: bn.running_var.numpy()[bn.running_var.numpy() < 0] = 0
 
         # create in torch
         with torch.no_grad():
@@ -14,22 +14,22 @@ m_init = np.random.randn(1,4).astype(np.float32)
 
 class TeenyNet:
   def __init__(self, tensor):
-    self.x = tensor(x_init.copy(), requires_grad=True)
-    self.W = tensor(W_init.copy(), requires_grad=True)
+    self.x = tensor(x_init, requires_grad=True)
+    self.W = tensor(W_init, requires_grad=True)
   def forward(self):
     return (self.x * self.W).sum()
 
 class TinyNet:
   def __init__(self, tensor):
-    self.x = tensor(x_init.copy(), requires_grad=True)
-    self.W = tensor(W_init.copy(), requires_grad=True)
-    self.m = tensor(m_init.copy())
+    self.x = tensor(x_init, requires_grad=True)
+    self.W = tensor(W_init, requires_grad=True)
+    self.m = tensor(m_init)
 
   def forward(self):
     out = self.x.matmul(self.W).relu()
     # print(out.detach().numpy())
     out = out.log_softmax(1)
-    out = out.mul(self.m).add(self.m).sum()
+    out = (out * self.m + self.m).sum()
     return out
 
 def step(tensor, optim, steps=1, teeny=False, **kwargs):
@@ -51,9 +51,9 @@ class TestOptim(unittest.TestCase):
     Tensor.training = self.old_training
 
   def _test_optim(self, tinygrad_optim, torch_optim, steps, opts, atol, rtol):
-    for x,y in zip(step(Tensor, tinygrad_optim, steps, **opts),
-                   step(torch.tensor, torch_optim, steps, **opts)):
-      np.testing.assert_allclose(x, y, atol=atol, rtol=rtol)
+    tx, tW = step(Tensor, tinygrad_optim, steps, **opts)
+    px, pW = step(torch.tensor, torch_optim, steps, **opts)
+    np.testing.assert_allclose(np.concatenate([tx.ravel(), tW.ravel()]), np.concatenate([px.ravel(), pW.ravel()]), atol=atol, rtol=rtol)
 
   def _test_sgd(self, steps, opts, atol, rtol): self._test_optim(SGD, torch.optim.SGD, steps, opts, atol, rtol)
   def _test_adam(self, steps, opts, atol, rtol): self._test_optim(Adam, torch.optim.Adam, steps, opts, atol, rtol)
@@ -124,7 +124,7 @@ class TestOptim(unittest.TestCase):
     for Opt in [Adam, AdamW, SGD]:
       losses = []
       for i in range(2):
-        w = Tensor(x_init.copy())
+        w = Tensor(x_init)
         opt = Opt([w], lr=0.1) if i == 0 else Opt([w, w], lr=0.1)
 
         loss = None
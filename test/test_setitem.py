@@ -140,11 +140,12 @@ class TestSetitem(unittest.TestCase):
         t.shrink(((v,v+1), None)).assign(a).realize()
 
       t = Tensor.zeros(6, 6).contiguous().realize()
+      a = Tensor.zeros(1, 6, dtype=dtypes.float).contiguous().realize()
       n = np.zeros((6, 6))
 
       for i in range(6):
         v = Variable("v", 0, 6).bind(i)
-        a = Tensor.full((1, 6), fill_value=i+1, dtype=dtypes.float).contiguous()
+        a.assign(Tensor.full((1, 6), fill_value=i+1, dtype=dtypes.float)).realize()
         n[i, :] = i+1
         f(t, a, v)
         np.testing.assert_allclose(t.numpy(), n)
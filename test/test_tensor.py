@@ -22,6 +22,10 @@ V_init = np.random.randn(3,3).astype(np.float32)
 W_init = np.random.randn(3,3).astype(np.float32)
 m_init = np.random.randn(1,3).astype(np.float32)
 gradient = np.random.randn(1,3).astype(np.float32)
+jacobian_W_init = np.random.RandomState(42069).random((10, 5)).astype(np.float32)
+jacobian_x_init = np.random.RandomState(69420).random((1, 10)).astype(np.float32)
+gradcheck_W_init = np.random.RandomState(1337).random((10, 5)).astype(np.float32)
+gradcheck_x_init = np.random.RandomState(7331).random((1, 10)).astype(np.float32)
 
 class TestTinygrad(unittest.TestCase):
   def test_zerodim_initialization(self):
@@ -196,16 +200,13 @@ class TestTinygrad(unittest.TestCase):
       np.testing.assert_allclose(non_zeros, expected, rtol=2e-3)
 
   def test_jacobian(self):
-    W = np.random.RandomState(42069).random((10, 5)).astype(np.float32)
-    x = np.random.RandomState(69420).random((1, 10)).astype(np.float32)
-
-    torch_x = torch.tensor(x, requires_grad=True)
-    torch_W = torch.tensor(W, requires_grad=True)
+    torch_x = torch.tensor(jacobian_x_init, requires_grad=True)
+    torch_W = torch.tensor(jacobian_W_init, requires_grad=True)
     def torch_func(x): return torch.nn.functional.log_softmax(x.matmul(torch_W).relu(), dim=1)
     PJ = torch.autograd.functional.jacobian(torch_func, torch_x).squeeze().numpy()
 
-    tiny_x = Tensor(x, requires_grad=True)
-    tiny_W = Tensor(W, requires_grad=True)
+    tiny_x = Tensor(jacobian_x_init, requires_grad=True)
+    tiny_W = Tensor(jacobian_W_init, requires_grad=True)
     def tiny_func(x): return x.dot(tiny_W).relu().log_softmax()
     J = jacobian(tiny_func, tiny_x)
     NJ = numerical_jacobian(tiny_func, tiny_x)
@@ -214,11 +215,8 @@ class TestTinygrad(unittest.TestCase):
     np.testing.assert_allclose(PJ, NJ, atol = 1e-3)
 
   def test_gradcheck(self):
-    W = np.random.RandomState(1337).random((10, 5)).astype(np.float32)
-    x = np.random.RandomState(7331).random((1, 10)).astype(np.float32)
-
-    tiny_x = Tensor(x, requires_grad=True)
-    tiny_W = Tensor(W, requires_grad=True)
+    tiny_x = Tensor(gradcheck_x_init, requires_grad=True)
+    tiny_W = Tensor(gradcheck_W_init, requires_grad=True)
     def tiny_func(x): return x.dot(tiny_W).relu().log_softmax()
 
     self.assertTrue(gradcheck(tiny_func, tiny_x, eps = 1e-3))
@@ -0,0 +1,47 @@
+import unittest
+from tinygrad import Tensor, Variable
+from tinygrad.dtype import dtypes
+from tinygrad.uop.ops import UOp, Ops, KernelInfo
+from tinygrad.renderer.cstyle import OpenCLRenderer
+from tinygrad.engine.realize import get_program
+
+def _programs(out:Tensor, arg=None):
+  return [get_program(si.ast if arg is None else si.ast.replace(arg=arg), OpenCLRenderer()) for si in out.schedule() if si.ast.op is Ops.SINK]
+
+class TestOpenCLReqdWorkGroupSize(unittest.TestCase):
+  def test_matches_local_size(self):
+    a, b = Tensor.empty(64, 64), Tensor.empty(64, 64)
+    for out in [a+1, a@b, (a+b).sum(1)]:
+      for p in _programs(out):
+        assert p.local_size is not None and p.local_size != [1,1,1], f"expected locals in {p.name}"
+        self.assertIn(f"__attribute__((reqd_work_group_size({','.join(str(x) for x in p.local_size)})))", p.src)
+
+  def test_no_locals(self):
+    for p in _programs(Tensor.empty(64, 64)+1, KernelInfo(opts_to_apply=())):
+      self.assertNotIn("reqd_work_group_size", p.src)
+
+  def test_symbolic_locals(self):
+    g = UOp(Ops.DEFINE_GLOBAL, dtypes.float.ptr(), arg=0)
+    n = Variable("n", 1, 16).replace(dtype=dtypes.int)
+    lidx, c = UOp(Ops.SPECIAL, dtypes.int, (n,), "lidx0"), UOp.const(dtypes.float, 1.0)
+    src = OpenCLRenderer().render([g, n, lidx, c, idx:=g.index(lidx), idx.store(c)])
+    self.assertNotIn("reqd_work_group_size", src)
+
+class TestOpenCLMulacc(unittest.TestCase):
+  def _matmul_src(self, dtype) -> str:
+    (p,) = _programs(Tensor.empty(16, 16, dtype=dtype)@Tensor.empty(16, 16, dtype=dtype), KernelInfo(opts_to_apply=()))
+    return p.src
+
+  def test_float_fma(self):
+    src = self._matmul_src(dtypes.float)
+    self.assertIn("fma(val0,val1,(*(acc0+0)))", src)
+    # only the accumulate is fused, not the index math
+    self.assertEqual(src.count("fma("), 1)
+
+  def test_int_no_fma(self):
+    src = self._matmul_src(dtypes.int)
+    self.assertIn("((val0*val1)+(*(acc0+0)))", src)
+    self.assertNotIn("fma(", src)
+
+if __name__ == '__main__':
+  unittest.main()
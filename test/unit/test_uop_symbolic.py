@@ -46,20 +46,14 @@ class TestSymbolic(unittest.TestCase):
     self.helper_test_variable(Variable("a", 3, 8) >= 8, 0, 1, "((a<8)!=True)")
 
   def test_ge(self):
-    self.helper_test_variable(Variable("a", 3, 8) >= 77, 0, 0, "False")
-    self.helper_test_variable(Variable("a", 3, 8) >= 9, 0, 0, "False")
-    self.helper_test_variable(Variable("a", 3, 8) >= 8, 0, 1, "((a<8)!=True)")
-    self.helper_test_variable(Variable("a", 3, 8) >= 4, 0, 1, "((a<4)!=True)")
-    self.helper_test_variable(Variable("a", 3, 8) >= 3, 1, 1, "True")
-    self.helper_test_variable(Variable("a", 3, 8) >= 2, 1, 1, "True")
+    a = Variable("a", 3, 8)
+    for c,n,m,s in [(77,0,0,"False"), (9,0,0,"False"), (8,0,1,"((a<8)!=True)"), (4,0,1,"((a<4)!=True)"), (3,1,1,"True"), (2,1,1,"True")]:
+      self.helper_test_variable(a >= c, n, m, s)
 
   def test_lt(self):
-    self.helper_test_variable(Variable("a", 3, 8) < 77, 1, 1, "True")
-    self.helper_test_variable(Variable("a", 3, 8) < 9, 1, 1, "True")
-    self.helper_test_variable(Variable("a", 3, 8) < 8, 0, 1, "(a<8)")
-    self.helper_test_variable(Variable("a", 3, 8) < 4, 0, 1, "(a<4)")
-    self.helper_test_variable(Variable("a", 3, 8) < 3, 0, 0, "False")
-    self.helper_test_variable(Variable("a", 3, 8) < 2, 0, 0, "False")
+    a = Variable("a", 3, 8)
+    for c,n,m,s in [(77,1,1,"True"), (9,1,1,"True"), (8,0,1,"(a<8)"), (4,0,1,"(a<4)"), (3,0,0,"False"), (2,0,0,"False")]:
+      self.helper_test_variable(a < c, n, m, s)
     self.helper_test_variable(Variable("a", 3, 4) < Variable("b", 5, 6), 1, 1, "True")
     self.helper_test_variable(Variable("a", 3, 5) < Variable("b", 5, 6), 0, 1, "(a<b)")
     self.helper_test_variable(Variable("a", 5, 6) < Variable("b", 3, 5), 0, 0, "False")
@@ -12,6 +12,7 @@ def _expand_arg_to_idx(args:tuple[tuple[int, int], ...], rpk:dict[int, int]) ->
     mul *= m
   return idx
 
+@functools.cache
 def _choices_from_args(args:tuple[tuple[int, int], ...]) -> list[dict[int, int]]:
   return [dict(x) for x in itertools.product(*[zip(itertools.repeat(axis), range(m)) for axis,m in args])]
 
@@ -76,9 +77,9 @@ def do_contract(con:UOp):
   if ex.op is not Ops.UNROLL: return UOp(Ops.VECTORIZE, con.dtype, con.src*con.dtype.count)
   # CONTRACT may remove several axes from UNROLL
   assert con.dtype == dtypes.void or con.dtype.count == prod([x[1] for x in con.arg]), "dtype is wrong"
-  idxs = []
+  idxs, con_choices = [], _choices_from_args(con.arg)
   for rpk in _choices_from_args(new_ex_args:=tuple(x for x in ex.arg if x not in con.arg)):
-    idxs += [_expand_arg_to_idx(ex.arg, {**rpk, **lrpk}) for lrpk in _choices_from_args(con.arg)]
+    idxs += [_expand_arg_to_idx(ex.arg, {**rpk, **lrpk}) for lrpk in con_choices]
   return UOp(Ops.UNROLL, con.dtype, (ex.src[0].gep(tuple(idxs)),), new_ex_args)
 
 expander = PatternMatcher([
@@ -100,15 +101,20 @@ expander = PatternMatcher([
 ])
 
 def create_gate(root:UOp) -> UOp|None:
-  @functools.cache
-  def _gate_srcs(u:UOp, gate:UOp) -> UOp:
-    if u.op is Ops.BARRIER: return u
-    if u.op is Ops.LOAD and u.src[-1].op is Ops.BARRIER:
-      return UOp(u.op, u.dtype, u.src[:-1]+(UOp(Ops.IF, src=(gate, u.src[-1])),), arg=u.arg)
-    return u if (replace_source:=tuple(_gate_srcs(x, gate) for x in u.src)) == u.src else UOp(u.op, u.dtype, replace_source, u.arg)
   idx = root.src[0]
   if idx.op is Ops.CAST: idx = idx.src[0]
-  return None if idx.op is not Ops.INDEX or len(idx.src) == 2 or (ret:=_gate_srcs(root, idx.src[2])) is root else ret
+  if idx.op is not Ops.INDEX or len(idx.src) == 2: return None
+  # the gate is fixed for this store, so memo on the UOp alone
+  gate = idx.src[2]
+  memo: dict[UOp, UOp] = {}
+  def _gate_srcs(u:UOp) -> UOp:
+    if (ret:=memo.get(u)) is not None: return ret
+    if u.op is Ops.BARRIER: ret = u
+    elif u.op is Ops.LOAD and u.src[-1].op is Ops.BARRIER: ret = UOp(u.op, u.dtype, u.src[:-1]+(UOp(Ops.IF, src=(gate, u.src[-1])),), arg=u.arg)
+    else: ret = u if (replace_source:=tuple(_gate_srcs(x) for x in u.src)) == u.src else UOp(u.op, u.dtype, replace_source, u.arg)
+    memo[u] = ret
+    return ret
+  return None if (ret:=_gate_srcs(root)) is root else ret
 
 migrate_indexing = PatternMatcher([
   # create gate MUST BE BEFORE expander
@@ -123,8 +129,8 @@ def fix_reduce_unroll(x:UOp):
   reduce_expand = [x for x in reduce_expand if x.op is not Ops.CONST]
   assert all(x.op is Ops.UNROLL for x in reduce_expand), f"not all UNROLLS in {reduce_expand}"
   ret = x.src[0]
-  if len(contract_axis:=flatten(x.arg for x in reduce_expand)):
-    ret = UOp(Ops.CONTRACT, x.dtype.vec(prod(x[1] for x in contract_axis)), (ret,), tuple(contract_axis), tag=1)
+  if len(contract_axis:=tuple(flatten(x.arg for x in reduce_expand))):
+    ret = UOp(Ops.CONTRACT, x.dtype.vec(prod(x[1] for x in contract_axis)), (ret,), contract_axis, tag=1)
   # REDUCE supports both "horizontal" reduction and range reduction. the horizontal elements are taken in the nearest group
   return x.replace(src=(ret,)+tuple(reduce_range))
 
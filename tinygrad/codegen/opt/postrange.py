@@ -2,7 +2,7 @@ from __future__ import annotations
 import math, itertools
 from collections import defaultdict
 from typing import cast, Final
-from tinygrad.uop.ops import PatternMatcher, UPat, Ops, UOp, KernelInfo, graph_rewrite, AxisType, ssimplify, can_pad, GroupOp
+from tinygrad.uop.ops import PatternMatcher, UPat, Ops, UOp, KernelInfo, graph_rewrite, AxisType, ssimplify, can_pad, GroupOp, sint
 from tinygrad.device import Buffer
 from tinygrad.dtype import AddrSpace, dtypes, ImageDType
 from tinygrad.helpers import colored, BEAM, getenv, DEBUG, to_function_name, NOOPT, argsort, round_up, prod, merge_dicts, get_single_element
@@ -21,15 +21,23 @@ class Scheduler:
     self.ast, self.opts = ast, opts
     self.dont_use_locals = self.ast.arg.dont_use_locals if self.ast.arg is not None else False
     self.applied_opts = list(self.ast.arg.applied_opts) if self.ast.arg is not None else []
+    self._shape_ast: UOp|None = None
+    self._shape_cache: tuple[tuple[UOp, ...], tuple[sint, ...]] = ((), ())
 
   @property
-  def rngs(self):
-    # always in order by axistype
-    return sorted([u for u in self.ast.parents if u.op is Ops.RANGE and u.vmax > 0], key=lambda x: (axis_to_pos[x.arg[-1]],) + x.arg[0:-1])
+  def _shape(self) -> tuple[tuple[UOp, ...], tuple[sint, ...]]:
+    # the ast is immutable, so the ranges and their sizes are only recomputed when an opt replaces it
+    if self._shape_ast is not self.ast:
+      # always in order by axistype
+      rngs = sorted([u for u in self.ast.parents if u.op is Ops.RANGE and u.vmax > 0], key=lambda x: (axis_to_pos[x.arg[-1]],) + x.arg[0:-1])
+      self._shape_cache, self._shape_ast = (tuple(rngs), tuple([ssimplify(x.src[0]) for x in rngs])), self.ast
+    return self._shape_cache
+  @property
+  def rngs(self) -> tuple[UOp, ...]: return self._shape[0]
   @property
   def shape_len(self): return len(self.rngs)
   @property
-  def full_shape(self): return [ssimplify(x.src[0]) for x in self.rngs]
+  def full_shape(self) -> tuple[sint, ...]: return self._shape[1]
   @property
   def axis_types(self): return [x.arg[-1] for x in self.rngs]
   @property
@@ -199,8 +207,9 @@ class Scheduler:
           replaces[b] = b.replace(src=(b.src[0],(valid&b.src[1].get_valid()).where(i, UOp.invalid())))
       self.ast = self.ast.substitute(replaces, f"padto {rng.arg[:-1]} {opt.arg}")
     elif opt.op is OptOps.SWAP:
+      check(isinstance(opt.arg, int), "SWAP arg must be an int")
       try:
-        altrng = self.rngs[opt.arg]
+        altrng = self.rngs[cast(int, opt.arg)]
       except IndexError:
         raise KernelOptError
       check(rng.arg[-1] == AxisType.GLOBAL and altrng.arg[-1] == AxisType.GLOBAL, "swap only for globals")
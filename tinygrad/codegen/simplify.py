@@ -19,6 +19,7 @@ def count_divmod(x:UOp): return len([u for u in x.toposort() if u.op in {Ops.IDI
 def simplify_merge_adjacent(u:UOp) -> UOp|None:
   reduce_ranges = [x.ranges for x in u.sparents if x.op is Ops.REDUCE]
   i = range_start[u.op]
+  u_divmod: int|None = None
   while i < len(u.src)-1:
     r0, r1 = u.src[i], u.src[i+1]
     # check same type
@@ -31,9 +32,10 @@ def simplify_merge_adjacent(u:UOp) -> UOp|None:
         nidx = graph_rewrite(u, _substitute+symbolic_flat+pm_flatten_range, ctx={r0:new_range//s1, r1:new_range%s1},
                              name=f"check_merge_{r0.arg[0]}_{r1.arg[0]}")
 
-        # check if it simplifies
-        if count_divmod(nidx) <= count_divmod(u):
-          u = nidx
+        # check if it simplifies, only counting the current divmods once there is a candidate
+        if u_divmod is None: u_divmod = count_divmod(u)
+        if (nidx_divmod:=count_divmod(nidx)) <= u_divmod:
+          u, u_divmod = nidx, nidx_divmod
           continue
     i += 1
   return u
@@ -116,7 +118,7 @@ pm_reduce_collapse = PatternMatcher([
 ])+sym
 
 def reduce_collapse(red:UOp):
-  included, not_included = partition(red.parents, lambda x: any(y in x.sparents for y in red.src[1:]))
+  included, not_included = partition(red.parents, lambda x: any(y is x or y in x.parents for y in red.src[1:]))
   if any(x.op in {Ops.STORE, Ops.REDUCE} for x in included): return None
   replaces: dict[UOp, UOp] = {}
   for u in included:
@@ -129,7 +131,7 @@ def reduce_collapse(red:UOp):
 
 def reduce_unparented(red:UOp):
   if red.arg not in {Ops.ADD, Ops.MAX, Ops.MUL}: return None
-  reduce_parented, reduce_unparented = partition(red.src[1:], lambda x: x in red.src[0].sparents)
+  reduce_parented, reduce_unparented = partition(red.src[1:], lambda x: x is red.src[0] or x in red.src[0].parents)
   if len(reduce_unparented) == 0: return None
   ret = red.replace(src=(red.src[0],)+tuple(reduce_parented)) if len(reduce_parented) or red.dtype != red.src[0].dtype else red.src[0]
   if red.arg is Ops.ADD:
@@ -113,13 +113,23 @@ class View:
   contiguous:bool
 
   def to_valid_uop(self, idxs:Sequence[UOp]|None=None) -> UOp:
-    """valid.where(idx, INVALID)"""
+    """valid.where(idx, INVALID), or just idx when the view is unmasked"""
     if idxs is None: idxs = [UOp.range(s, i) for i,s in enumerate(self.shape)]
     iexpr = sint_to_uop(self.offset)
+    if self.mask is None and all(x.dtype is dtypes.index for x in idxs):
+      # fast path: always valid, and int strides of 0/1 don't need a MUL for sym to fold away
+      for idx,st in zip(idxs, self.strides):
+        if isinstance(st, int) and st == 0: continue
+        iexpr = iexpr + (idx if isinstance(st, int) and st == 1 else idx*sint_to_uop(st))
+      return iexpr
     where = UOp.const(dtypes.bool, True)
     for idx,sh,st,m in zip(idxs, self.shape, self.strides, self.mask if self.mask is not None else itertools.repeat(None)):
       iexpr = iexpr + idx*sint_to_uop(st)
       if m is not None:
+        # a const idx (e.g. from unravel of a const) is decided here instead of emitting compares for sym to fold
+        if idx.op is Ops.CONST and all_int(m):
+          if not m[0] <= idx.arg < m[1]: where = UOp.const(dtypes.bool, False)
+          continue
         if resolve(m[0] != 0): where &= (idx >= sint_to_uop(m[0]))
         if resolve(m[1] != sh): where &= (idx < sint_to_uop(m[1]))
     return where.where(iexpr, UOp.invalid())
@@ -640,9 +640,13 @@ class UOp(MathTrait, metaclass=UOpMetaClass):
     return fxn(**{k:v for k,v in var_vals.items() if k in varnames})
 
   def render(self, simplify=True, pm:PatternMatcher|None=None) -> str:
+    # UOps are immutable, so the default render is cached
+    if simplify and pm is None: return self._render
     with Context(TRACK_MATCH_STATS=0, SPEC=0):
       ret = graph_rewrite(self.simplify() if simplify else self, renderer if pm is None else pm)
     return ret.arg if ret.op is Ops.NOOP else str(ret)
+  @functools.cached_property
+  def _render(self) -> str: return self.render(pm=renderer)
 
 @dataclass(frozen=True)
 class KernelInfo: